@@ -1,17 +1,123 @@
+import struct
 import zlib
+from typing import List, Optional
 
 from eventsourcing.persistence import Compressor
 
+# Items are framed with a little-endian unsigned int length prefix.
+_LENGTH_PREFIX = struct.Struct("<I")
+
+# Deflate can't expand compressed data by more than this factor.
+_MAX_DEFLATE_RATIO = 1032
+
 
 class ZlibCompressor(Compressor):
+    def __init__(self, level: int = zlib.Z_BEST_SPEED, zdict: Optional[bytes] = None):
+        """
+        Initialises zlib compressor with compression ``level``,
+        and optionally a preset dictionary ``zdict``.
+
+        The compression level is an int from 0 to 9. Higher levels
+        compress larger amounts of data somewhat more, at a much
+        greater cost in time. The default level 1 (the fastest) can
+        take less than half the time of zlib's default level 6, with
+        output that is typically 10% to 30% larger. For small amounts
+        of data the difference is slight. The compression level doesn't
+        affect the speed of decompression.
+
+        A preset dictionary primes the compressor with byte sequences
+        that are expected to occur in the data, such as the keys and
+        transcoding names that recur in the state of stored events,
+        which improves the compression of small amounts of data. Data
+        compressed with a preset dictionary can only be decompressed
+        with the same dictionary.
+
+        :param int level: zlib compression level
+        :param bytes zdict: preset dictionary
+        """
+        self.level = level
+        self.zdict = zdict
+
     def compress(self, data: bytes) -> bytes:
         """
         Compress bytes using zlib.
         """
-        return zlib.compress(data)
+        if self.zdict is None:
+            return zlib.compress(data, self.level)
+        compressobj = zlib.compressobj(self.level, zdict=self.zdict)
+        return compressobj.compress(data) + compressobj.flush()
 
     def decompress(self, data: bytes) -> bytes:
         """
         Decompress bytes using zlib.
         """
-        return zlib.decompress(data)
+        if self.zdict is None:
+            return zlib.decompress(data)
+        decompressobj = zlib.decompressobj(zdict=self.zdict)
+        decompressed = decompressobj.decompress(data) + decompressobj.flush()
+        if not decompressobj.eof:
+            raise zlib.error("incomplete or truncated stream")
+        return decompressed
+
+    def _decompress_sized(self, data: bytes, size: int) -> bytes:
+        # The expected size is read from the data, so it is only trusted
+        # as far as it can't cause more memory to be used than the data
+        # could possibly decompress to.
+        if self.zdict is None:
+            bufsize = min(size, len(data) * _MAX_DEFLATE_RATIO)
+            return zlib.decompress(data, bufsize=bufsize)
+        # Stop as soon as the output is longer than expected.
+        decompressobj = zlib.decompressobj(zdict=self.zdict)
+        decompressed = decompressobj.decompress(data, size + 1)
+        if len(decompressed) <= size and not decompressobj.eof:
+            raise zlib.error("incomplete or truncated stream")
+        return decompressed
+
+    def compress_many(self, items: List[bytes]) -> bytes:
+        """
+        Compress a list of bytes items together using zlib, so
+        that the overhead of compression is incurred once for
+        the list rather than once for each item.
+
+        The length of the uncompressed data is prefixed to the
+        compressed data, and is checked against the length of the
+        decompressed data. Without a preset dictionary, it is also
+        used to size the output buffer when decompressing, up to the
+        largest size the compressed data could decompress to. With a
+        preset dictionary, it is used to stop decompressing as soon
+        as the output is longer than expected.
+        """
+        pack = _LENGTH_PREFIX.pack
+        framed = b"".join([pack(len(item)) + item for item in items])
+        return pack(len(framed)) + self.compress(framed)
+
+    def decompress_many(self, data: bytes) -> List[bytes]:
+        """
+        Decompress a list of bytes items previously compressed
+        together by :func:`compress_many`.
+
+        Raises :class:`ValueError` if the data isn't correctly framed.
+        """
+        unpack_from = _LENGTH_PREFIX.unpack_from
+        prefix_size = _LENGTH_PREFIX.size
+        if len(data) < prefix_size:
+            raise ValueError("Compressed items are missing their length prefix")
+        (size,) = unpack_from(data)
+        framed = self._decompress_sized(data[prefix_size:], size)
+        if len(framed) != size:
+            raise ValueError(
+                f"Decompressed {len(framed)} bytes but expected {size} bytes"
+            )
+        items = []
+        offset = 0
+        end = len(framed)
+        while offset < end:
+            if offset + prefix_size > end:
+                raise ValueError(f"Item at offset {offset} has a truncated prefix")
+            (length,) = unpack_from(framed, offset)
+            offset += prefix_size
+            if offset + length > end:
+                raise ValueError(f"Item of length {length} is truncated")
+            items.append(framed[offset : offset + length])
+            offset += length
+        return items
@@ -10,6 +10,8 @@ class AccountNotFoundError(Exception):
 
 
 class BankAccounts(Application):
+    snapshotting_intervals = {BankAccount: 100}
+
     def open_account(self, full_name: str, email_address: str) -> UUID:
         account = BankAccount.open(
             full_name=full_name,
@@ -2,6 +2,7 @@ import unittest
 from decimal import Decimal
 from uuid import uuid4
 
+from eventsourcing.application import Repository
 from eventsourcing.examples.bankaccounts.application import (
     AccountNotFoundError,
     BankAccounts,
@@ -172,3 +173,53 @@ class TestBankAccounts(unittest.TestCase):
                 account_id=account_id1,
                 overdraft_limit=Decimal("500.00"),
             )
+
+    def test_snapshotting(self) -> None:
+        app = BankAccounts()
+
+        # Create an account.
+        account_id = app.open_account(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+
+        # Set overdraft limit.
+        app.set_overdraft_limit(
+            account_id=account_id,
+            overdraft_limit=Decimal("500.00"),
+        )
+
+        # Deposit and withdraw funds, so account has 250 events.
+        for _ in range(124):
+            app.deposit_funds(
+                credit_account_id=account_id,
+                amount=Decimal("10.00"),
+            )
+            app.withdraw_funds(
+                debit_account_id=account_id,
+                amount=Decimal("5.00"),
+            )
+
+        # Check snapshots have been taken at regular intervals.
+        assert app.snapshots
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(
+            [snapshot.originator_version for snapshot in snapshots],
+            [100, 200],
+        )
+
+        # Check account reconstructed from snapshot has correct state.
+        account = app.get_account(account_id)
+        self.assertEqual(account.version, 250)
+        self.assertEqual(account.balance, Decimal("620.00"))
+        self.assertEqual(account.overdraft_limit, Decimal("500.00"))
+
+        # Check it is equal to account reconstructed from all events.
+        self.assertEqual(Repository(app.events).get(account_id), account)
+
+        # Check overdraft limit still applies after snapshot.
+        with self.assertRaises(InsufficientFundsError):
+            app.withdraw_funds(
+                debit_account_id=account_id,
+                amount=Decimal("1120.01"),
+            )
@@ -5,17 +5,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import (
-    Any,
-    Dict,
-    Generic,
-    Iterator,
-    List,
-    Mapping,
-    Optional,
-    Type,
-    cast,
-)
+from typing import Any, Dict, Generic, Iterator, List, Mapping, Optional, Type
 from uuid import UUID
 
 from eventsourcing.domain import DomainEvent, TDomainEvent
@@ -111,12 +101,10 @@ class JSONTranscoder(Transcoder):
             }
 
     def _decode_obj(self, d: Dict[str, Any]) -> Any:
-        if set(d.keys()) == {
-            "_type_",
-            "_data_",
-        }:
-            t = d["_type_"]
-            t = cast(str, t)
+        # Called for every decoded dict, so avoid constructing
+        # a set of keys just to check for a transcoded object.
+        if len(d) == 2 and "_type_" in d and "_data_" in d:
+            t: str = d["_type_"]
             try:
                 transcoding = self.names[t]
             except KeyError:
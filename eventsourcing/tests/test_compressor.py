@@ -0,0 +1,135 @@
+import struct
+import tracemalloc
+import zlib
+from unittest.case import TestCase
+
+from eventsourcing.compressor import ZlibCompressor
+
+
+class TestZlibCompressor(TestCase):
+    def test_compress_and_decompress(self):
+        compressor = ZlibCompressor()
+
+        # Check data can be compressed and recovered.
+        data = b'{"amount": {"_type_": "decimal_str", "_data_": "10.00"}}' * 10
+        compressed = compressor.compress(data)
+        self.assertLess(len(compressed), len(data))
+        self.assertEqual(compressor.decompress(compressed), data)
+
+        # Check the default compression level is the fastest.
+        self.assertEqual(compressor.level, zlib.Z_BEST_SPEED)
+        self.assertEqual(compressed, zlib.compress(data, zlib.Z_BEST_SPEED))
+
+        # Check compression level can be set.
+        compressor = ZlibCompressor(level=9)
+        compressed = compressor.compress(data)
+        self.assertEqual(compressed, zlib.compress(data, 9))
+        self.assertEqual(ZlibCompressor().decompress(compressed), data)
+
+    def test_compress_and_decompress_with_zdict(self):
+        zdict = b'{"_type_": "decimal_str", "_data_": "amount": '
+        compressor = ZlibCompressor(zdict=zdict)
+
+        # Check data can be compressed and recovered.
+        data = b'{"amount": {"_type_": "decimal_str", "_data_": "10.00"}}'
+        compressed = compressor.compress(data)
+        self.assertEqual(compressor.decompress(compressed), data)
+
+        # Check the preset dictionary improves compression of small data.
+        self.assertLess(len(compressed), len(ZlibCompressor().compress(data)))
+
+        # Check data can't be recovered without the preset dictionary.
+        with self.assertRaises(zlib.error):
+            ZlibCompressor().decompress(compressed)
+
+        # Check data compressed without a preset dictionary can be recovered.
+        self.assertEqual(compressor.decompress(zlib.compress(data)), data)
+
+        # Check truncated data can't be recovered.
+        with self.assertRaises(zlib.error):
+            compressor.decompress(compressed[:-4])
+
+        # Check items can be compressed together and recovered.
+        items = [data, data]
+        compressed = compressor.compress_many(items)
+        self.assertEqual(compressor.decompress_many(compressed), items)
+        compressed = compressor.compress_many([])
+        self.assertEqual(compressor.decompress_many(compressed), [])
+
+        # Check data larger than the default buffer size can be recovered.
+        data = data * 1000
+        self.assertEqual(compressor.decompress(compressor.compress(data)), data)
+        compressed = compressor.compress_many([data])
+        self.assertEqual(compressor.decompress_many(compressed), [data])
+
+    def test_compress_many_and_decompress_many(self):
+        compressor = ZlibCompressor()
+
+        # Check items can be compressed together and recovered.
+        items = [
+            b'{"amount": {"_type_": "decimal_str", "_data_": "%d.00"}}' % i
+            for i in range(7)
+        ]
+        items.append(b"")
+        compressed = compressor.compress_many(items)
+        self.assertEqual(compressor.decompress_many(compressed), items)
+
+        # Check compressing together is smaller than compressing separately.
+        self.assertLess(
+            len(compressed),
+            sum(len(compressor.compress(item)) for item in items),
+        )
+
+        # Check an empty list can be compressed and recovered.
+        compressed = compressor.compress_many([])
+        self.assertEqual(compressor.decompress_many(compressed), [])
+
+    def test_decompress_many_with_malformed_framing(self):
+        compressor = ZlibCompressor()
+
+        def compress_framed(framed: bytes) -> bytes:
+            return struct.pack("<I", len(framed)) + compressor.compress(framed)
+
+        # Check data without a length prefix can't be recovered.
+        with self.assertRaises(ValueError):
+            compressor.decompress_many(b"")
+        with self.assertRaises(ValueError):
+            compressor.decompress_many(b"\x00\x00")
+
+        # Check an item shorter than its length prefix can't be recovered.
+        with self.assertRaises(ValueError):
+            compressor.decompress_many(compress_framed(struct.pack("<I", 100) + b"abc"))
+
+        # Check trailing bytes shorter than a length prefix can't be recovered.
+        with self.assertRaises(ValueError):
+            compressor.decompress_many(
+                compress_framed(struct.pack("<I", 3) + b"abc" + b"\x01\x00")
+            )
+
+    def test_decompress_many_with_wrong_length_prefix(self):
+        for compressor in [ZlibCompressor(), ZlibCompressor(zdict=b"abc")]:
+            compressed = compressor.compress_many([b"abc", b"def"])
+            (size,) = struct.unpack_from("<I", compressed)
+            body = compressed[4:]
+
+            # Check the length of the decompressed data is checked.
+            for wrong_size in [size - 1, size + 1]:
+                with self.assertRaises(ValueError):
+                    compressor.decompress_many(struct.pack("<I", wrong_size) + body)
+
+    def test_decompress_many_with_huge_length_prefix(self):
+        for compressor in [ZlibCompressor(), ZlibCompressor(zdict=b"abc")]:
+            compressed = compressor.compress_many([b"abc"])
+            body = compressed[4:]
+
+            # Check a huge prefix doesn't cause a huge buffer to be allocated.
+            for huge_size in [2**31, 0xFFFFFFFF]:
+                data = struct.pack("<I", huge_size) + body
+                tracemalloc.start()
+                try:
+                    with self.assertRaises(ValueError):
+                        compressor.decompress_many(data)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                self.assertLess(peak, 1024 * 1024)
@@ -158,6 +158,19 @@ class TestTranscoder(TestCase):
         self.assertIsInstance(copy.value.value, UUID)
         self.assertEqual(copy.value.value, obj.value.value)
 
+        # Check dicts that aren't exactly transcoded objects are not decoded.
+        for d in [
+            {"_type_": "uuid_hex"},
+            {"_data_": "b2723fe2c01a40d2875ea3aac6a09ff5"},
+            {
+                "_type_": "uuid_hex",
+                "_data_": "b2723fe2c01a40d2875ea3aac6a09ff5",
+                "a": 1,
+            },
+            {"_type_": "uuid_hex", "a": "b2723fe2c01a40d2875ea3aac6a09ff5"},
+        ]:
+            self.assertEqual(transcoder.decode(transcoder.encode(d)), d)
+
         transcoder = JSONTranscoder()
         with self.assertRaises(TypeError) as cm:
             transcoder.decode(data)
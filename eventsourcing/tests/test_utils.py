@@ -1,7 +1,9 @@
+import gc
+import weakref
 from typing import cast
 from unittest import TestCase
 
-from eventsourcing.utils import retry, strtobool
+from eventsourcing.utils import get_topic, resolve_topic, retry, strtobool
 
 
 class TestRetryDecorator(TestCase):
@@ -140,3 +142,52 @@ class TestStrtobool(TestCase):
         for x in (None, True, False, 1, 2, 3):
             with self.assertRaises(TypeError):
                 strtobool(cast(str, x))
+
+
+class TestTopics(TestCase):
+    def test_get_topic_and_resolve_topic(self):
+        topic = get_topic(TestTopics)
+        self.assertEqual(topic, "eventsourcing.tests.test_utils:TestTopics")
+        self.assertIs(resolve_topic(topic), TestTopics)
+
+        # Check topic is the same when got again.
+        self.assertEqual(get_topic(TestTopics), topic)
+
+        # Check nested classes.
+        topic = get_topic(TestTopics.Nested)
+        self.assertEqual(topic, "eventsourcing.tests.test_utils:TestTopics.Nested")
+        self.assertIs(resolve_topic(topic), TestTopics.Nested)
+
+    def test_topic_resolves_to_class_last_got(self):
+        def define_class():
+            class A:
+                pass
+
+            return A
+
+        a1 = define_class()
+        a2 = define_class()
+        self.assertEqual(get_topic(a1), get_topic(a2))
+        self.assertIs(resolve_topic(get_topic(a2)), a2)
+        self.assertIs(resolve_topic(get_topic(a1)), a1)
+
+    def test_get_topic_does_not_keep_classes_alive(self):
+        def define_class():
+            class A:
+                pass
+
+            return A
+
+        classes = [define_class() for _ in range(3)]
+        refs = [weakref.ref(cls) for cls in classes]
+        for cls in classes:
+            get_topic(cls)
+
+        # Check only the class last got for the topic is kept.
+        del classes, cls
+        gc.collect()
+        self.assertIsNone(refs[0]())
+        self.assertIsNone(refs[1]())
+
+    class Nested:
+        pass
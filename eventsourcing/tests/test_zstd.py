@@ -0,0 +1,88 @@
+from datetime import datetime
+from decimal import Decimal
+from threading import Thread
+from unittest.case import TestCase
+from uuid import uuid4
+
+import zstandard
+
+from eventsourcing.domain import TZINFO
+from eventsourcing.persistence import (
+    DatetimeAsISO,
+    DecimalAsStr,
+    JSONTranscoder,
+    UUIDAsHex,
+)
+from eventsourcing.zstd import ZstdCompressor
+
+
+class TestZstdCompressor(TestCase):
+    def test_compress_and_decompress(self):
+        compressor = ZstdCompressor()
+
+        # Check data can be compressed and recovered.
+        data = b'{"amount": {"_type_": "decimal_str", "_data_": "10.00"}}' * 10
+        compressed = compressor.compress(data)
+        self.assertLess(len(compressed), len(data))
+        self.assertEqual(compressor.decompress(compressed), data)
+
+        # Check another instance can decompress.
+        self.assertEqual(ZstdCompressor().decompress(compressed), data)
+
+        # Check compression level can be set.
+        compressor = ZstdCompressor(level=19)
+        self.assertEqual(compressor.decompress(compressor.compress(data)), data)
+
+    def test_compress_and_decompress_with_dict(self):
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DecimalAsStr())
+        transcoder.register(DatetimeAsISO())
+
+        def create_sample(i: int) -> bytes:
+            return transcoder.encode(
+                {
+                    "timestamp": datetime.now(tz=TZINFO),
+                    "amount": Decimal(f"{i}.00"),
+                    "transaction_id": uuid4(),
+                }
+            )
+
+        # Train a dictionary.
+        samples = [create_sample(i) for i in range(1000)]
+        dict_data = ZstdCompressor.train_dict(samples, dict_size=4096)
+        self.assertIsInstance(dict_data, bytes)
+        self.assertLessEqual(len(dict_data), 4096)
+
+        # Check data can be compressed and recovered.
+        compressor = ZstdCompressor(dict_data=dict_data)
+        data = create_sample(1001)
+        compressed = compressor.compress(data)
+        self.assertEqual(compressor.decompress(compressed), data)
+
+        # Check the dictionary improves compression of small data.
+        self.assertLess(len(compressed), len(ZstdCompressor().compress(data)))
+
+        # Check data can't be recovered without the dictionary.
+        with self.assertRaises(zstandard.ZstdError):
+            ZstdCompressor().decompress(compressed)
+
+    def test_compress_and_decompress_in_threads(self):
+        compressor = ZstdCompressor()
+        errors = []
+
+        def compress_and_decompress(i: int) -> None:
+            try:
+                for j in range(100):
+                    data = f"thread {i} iteration {j}".encode("utf8") * 10
+                    compressed = compressor.compress(data)
+                    assert compressor.decompress(compressed) == data
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [Thread(target=compress_and_decompress, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
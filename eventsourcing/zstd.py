@@ -0,0 +1,74 @@
+import threading
+from typing import Optional, Sequence
+
+import zstandard
+
+from eventsourcing.persistence import Compressor
+
+
+class ZstdCompressor(Compressor):
+    """
+    Compressor strategy that uses Zstandard.
+    """
+
+    @staticmethod
+    def train_dict(samples: Sequence[bytes], dict_size: int = 16384) -> bytes:
+        """
+        Trains a Zstandard compression dictionary from given samples,
+        for example the transcoded state of some representative stored
+        events, and returns the dictionary as bytes.
+
+        :param Sequence[bytes] samples: representative data to be compressed
+        :param int dict_size: maximum size of the dictionary in bytes
+        """
+        return zstandard.train_dictionary(dict_size, list(samples)).as_bytes()
+
+    def __init__(self, level: int = 3, dict_data: Optional[bytes] = None):
+        """
+        Initialises Zstandard compressor with compression ``level``,
+        and optionally a compression dictionary ``dict_data``.
+
+        Compression and decompression contexts are constructed once
+        per thread and then reused, since constructing a context for
+        each call is comparatively expensive, and since a context
+        can't be used by more than one thread at the same time.
+
+        Data compressed with a dictionary can only be decompressed
+        with the same dictionary. Using a dictionary trained on
+        representative stored events greatly improves the compression
+        of small amounts of data.
+
+        :param int level: Zstandard compression level
+        :param bytes dict_data: dictionary, for example from :func:`train_dict`
+        """
+        self.level = level
+        self._dict: Optional[zstandard.ZstdCompressionDict] = None
+        if dict_data is not None:
+            self._dict = zstandard.ZstdCompressionDict(dict_data)
+            # Precompute the dictionary once, rather than in each context.
+            self._dict.precompute_compress(level=level)
+        self._contexts = threading.local()
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress bytes using Zstandard.
+        """
+        try:
+            cctx = self._contexts.cctx
+        except AttributeError:
+            cctx = self._contexts.cctx = zstandard.ZstdCompressor(
+                level=self.level, dict_data=self._dict
+            )
+        return cctx.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompress bytes using Zstandard.
+        """
+        try:
+            dctx = self._contexts.dctx
+        except AttributeError:
+            dctx = self._contexts.dctx = zstandard.ZstdDecompressor(
+                dict_data=self._dict
+            )
+        return dctx.decompress(data)
@@ -3,12 +3,14 @@ from distutils.core import setup
 from eventsourcing import __version__
 
 crypto_requires = ["pycryptodome<=3.10.99999"]
+zstd_requires = ["zstandard<=0.25.99999"]
 postgresql_requires = ["psycopg2<=2.9.99999"]
 postgresql_dev_requires = ["psycopg2-binary<=2.9.99999"]
 
 docs_requires = (
     postgresql_dev_requires
     + crypto_requires
+    + zstd_requires
     + [
         "Sphinx==1.8.5",
         "python_docs_theme",
@@ -58,6 +60,7 @@ setup(
         "postgres": postgresql_requires,
         "postgres_dev": postgresql_dev_requires,
         "crypto": crypto_requires,
+        "zstd": zstd_requires,
         "docs": docs_requires,
         "dev": dev_requires,
     },